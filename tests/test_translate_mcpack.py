@@ -0,0 +1,163 @@
+import io
+import os
+import zipfile
+
+import pytest
+
+import translate_mcpack as tm
+
+API = ("http://api.test/v1", "key", "model")
+
+
+@pytest.fixture(autouse=True)
+def clear_memory():
+    tm._translation_memory.clear()
+    yield
+    tm._translation_memory.clear()
+
+
+def make_zip_bytes():
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr("manifest.json", "{}")
+    return buf.getvalue()
+
+
+def make_service(tmp_path, **kwargs):
+    # workers=0：任务只入队不执行，便于检查队列状态
+    return tm.TranslationService({}, str(tmp_path), workers=0, **kwargs)
+
+
+def submit(service, name="a.mcpack", priority=0):
+    data = make_zip_bytes()
+    return service.submit(name, io.BytesIO(data), len(data), priority)
+
+
+# --- 翻译记忆 ---
+
+def test_translate_batch_only_sends_memory_misses(monkeypatch):
+    calls = []
+
+    def fake_request_batch(items, text_widget, api_url, api_key, model_name):
+        calls.append(dict(items))
+        return {k: "译:" + v for k, v in items.items()}
+
+    monkeypatch.setattr(tm, "request_batch", fake_request_batch)
+    assert tm.translate_batch({"a": "Apple"}, None, *API) == {"a": "译:Apple"}
+
+    result = tm.translate_batch({"x": "Bread", "y": "Apple"}, None, *API)
+    assert calls[-1] == {"x": "Bread"}
+    assert list(result.items()) == [("x", "译:Bread"), ("y", "译:Apple")]
+
+    calls.clear()
+    assert tm.translate_batch({"z": "Bread"}, None, *API) == {"z": "译:Bread"}
+    assert calls == []
+
+
+def test_translate_batch_failure_is_not_cached(monkeypatch):
+    monkeypatch.setattr(tm, "request_batch", lambda *args: None)
+    assert tm.translate_batch({"a": "Apple"}, None, *API) is None
+    assert tm.memory_lookup(API[0], API[2], "Apple") is None
+
+
+def test_translate_text_multiline_does_not_share_memory(monkeypatch):
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"choices": [{"message": {"content": "第一行\n第二行"}}]}
+
+    monkeypatch.setattr(tm, "api_post", lambda *args, **kwargs: FakeResponse())
+    monkeypatch.setattr(tm.time, "sleep", lambda seconds: None)
+    assert tm.translate_text("Line one\nLine two", None, *API) == "第一行"
+
+    batch_calls = []
+    monkeypatch.setattr(tm, "request_batch", lambda items, *args: batch_calls.append(items) or {"k": "第一行\n第二行"})
+    assert tm.translate_batch({"k": "Line one\nLine two"}, None, *API) == {"k": "第一行\n第二行"}
+    assert batch_calls
+
+
+# --- 打包 ---
+
+def test_repackage_archive_keeps_empty_directories(tmp_path):
+    src = tmp_path / "src"
+    (src / "emptydir").mkdir(parents=True)
+    (src / "texts").mkdir()
+    (src / "texts" / "en_US.lang").write_text("a=b\n", encoding="utf-8")
+    out = tmp_path / "out.mcpack"
+
+    tm.repackage_archive(str(src), str(out))
+    with zipfile.ZipFile(out) as z:
+        names = z.namelist()
+    assert "emptydir/" in names
+    assert "texts/en_US.lang" in names
+
+
+# --- 任务队列 ---
+
+def test_submit_orders_queue_by_priority_then_arrival(tmp_path):
+    service = make_service(tmp_path)
+    low = submit(service, priority=0)
+    high = submit(service, priority=5)
+    low2 = submit(service, priority=0)
+
+    order = [service.job_queue.get()[2] for _ in range(3)]
+    assert order == [high.job_id, low.job_id, low2.job_id]
+    assert all(job.status == "queued" for job in service.list())
+
+
+@pytest.mark.parametrize("data, length", [(b"not a zip", 9), (make_zip_bytes(), 10 ** 6)])
+def test_submit_rejects_invalid_or_truncated_upload(tmp_path, data, length):
+    service = make_service(tmp_path)
+    with pytest.raises(ValueError):
+        service.submit("a.mcpack", io.BytesIO(data), length)
+    assert os.listdir(tmp_path) == []
+    assert service.list() == []
+
+
+def test_delete_cancels_queued_job_and_removes_files(tmp_path):
+    service = make_service(tmp_path)
+    job = submit(service)
+
+    assert service.delete(job.job_id) is job
+    assert job.status == "cancelled"
+    assert service.get(job.job_id) is None
+    assert not os.path.exists(os.path.dirname(job.input_path))
+    assert service.delete(job.job_id) is None
+
+
+def test_delete_keeps_running_job(tmp_path):
+    service = make_service(tmp_path)
+    job = submit(service)
+    job.status = "running"
+
+    assert service.delete(job.job_id) is job
+    assert service.get(job.job_id) is job
+    assert os.path.exists(job.input_path)
+
+
+def test_evict_finished_applies_ttl_and_max_count(tmp_path):
+    service = make_service(tmp_path, job_ttl=100, max_finished_jobs=2)
+    jobs = [submit(service) for _ in range(4)]
+    for i, job in enumerate(jobs[:3]):
+        job.status = "done"
+        job.finished_at = 1000 + i
+    queued = jobs[3]
+
+    evicted = service.evict_finished(now=1050)
+    assert evicted == [jobs[0]]
+    assert not os.path.exists(os.path.dirname(jobs[0].input_path))
+
+    evicted = service.evict_finished(now=1101.5)
+    assert evicted == [jobs[1]]
+    assert [job.job_id for job in service.list()] == [jobs[2].job_id, queued.job_id]
+
+
+def test_evict_finished_skips_jobs_without_finish_time(tmp_path):
+    service = make_service(tmp_path, job_ttl=0, max_finished_jobs=0)
+    job = submit(service)
+    job.status = "done"
+
+    assert service.evict_finished() == []
+    assert service.get(job.job_id) is job
@@ -8,7 +8,15 @@ import time
 import threading
 import traceback
 import re
+import uuid
+import queue
+import argparse
+import hmac
+import ipaddress
+from collections import OrderedDict, deque
 from itertools import islice
+from urllib.parse import urlparse, parse_qs, quote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 # --- 新增导入 ---
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -48,6 +56,57 @@ def load_config():
 
 # --- 后端逻辑 (翻译函数) ---
 
+# --- 共享的 HTTP 会话、全局并发预算与翻译记忆 ---
+# 所有 API 请求复用同一个 Session，使连接池在多个文件、多个任务之间保持热连接。
+_http_session = requests.Session()
+# 全局 API 并发预算；为 None 时不做限制（GUI 模式的默认行为）。
+_api_semaphore = None
+
+# 翻译记忆：缓存 (API 地址, 模型, 原文) -> 译文，超过上限时淘汰最久未使用的条目。
+TRANSLATION_MEMORY_LIMIT = 50000
+_translation_memory = OrderedDict()
+_translation_memory_lock = threading.Lock()
+
+def set_api_concurrency(max_concurrency):
+    """设置全局 API 并发上限，并按该上限调整连接池大小。"""
+    global _api_semaphore
+    if max_concurrency and max_concurrency > 0:
+        _api_semaphore = threading.BoundedSemaphore(max_concurrency)
+        pool_size = max(10, max_concurrency)
+    else:
+        _api_semaphore = None
+        pool_size = 10
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    _http_session.mount("https://", adapter)
+    _http_session.mount("http://", adapter)
+
+def api_post(api_url, **kwargs):
+    """通过共享会话发送 API 请求，并遵守全局并发预算。"""
+    if _api_semaphore is None:
+        return _http_session.post(api_url, **kwargs)
+    with _api_semaphore:
+        return _http_session.post(api_url, **kwargs)
+
+def memory_lookup(api_url, model_name, text):
+    """从翻译记忆中查找译文，未命中时返回 None。"""
+    key = (api_url, model_name, text)
+    with _translation_memory_lock:
+        translated = _translation_memory.get(key)
+        if translated is not None:
+            _translation_memory.move_to_end(key)
+        return translated
+
+def memory_store(api_url, model_name, text, translated):
+    """将一条译文写入翻译记忆。"""
+    if not isinstance(translated, str):
+        return
+    key = (api_url, model_name, text)
+    with _translation_memory_lock:
+        _translation_memory[key] = translated
+        _translation_memory.move_to_end(key)
+        while len(_translation_memory) > TRANSLATION_MEMORY_LIMIT:
+            _translation_memory.popitem(last=False)
+
 def log_message(text_widget, message):
     """向 GUI 的文本小部件中插入一条消息。"""
     if text_widget:
@@ -175,6 +234,12 @@ def translate_text(text, text_widget, api_url, api_key, model_name):
         log_message(text_widget, "警告：API 地址、密钥或模型为空，跳过翻译。")
         return text
 
+    # 单条翻译只保留回复的第一行，多行原文不与批量翻译共享翻译记忆，避免存入或取出被截断的译文
+    use_memory = "\n" not in text
+    cached = memory_lookup(api_url, model_name, text) if use_memory else None
+    if cached is not None:
+        return cached
+
     headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
     payload = {
         "model": model_name,
@@ -189,11 +254,13 @@ def translate_text(text, text_widget, api_url, api_key, model_name):
 
     for attempt in range(retries):
         try:
-            response = requests.post(api_url, headers=headers, json=payload, timeout=timeout_seconds)
+            response = api_post(api_url, headers=headers, json=payload, timeout=timeout_seconds)
             response.raise_for_status()
             result = response.json()
             raw_translated_text = result['choices'][0]['message']['content'].strip()
             translated_text = raw_translated_text.splitlines()[0].strip()
+            if use_memory:
+                memory_store(api_url, model_name, text, translated_text)
             time.sleep(0.2)
             return translated_text
         except requests.exceptions.RequestException as e:
@@ -211,6 +278,29 @@ def translate_text(text, text_widget, api_url, api_key, model_name):
 
 def translate_batch(items_dict, text_widget, api_url, api_key, model_name):
     if not items_dict: return {}
+    # 先查翻译记忆，只把未命中的条目发给 API；结果按输入顺序返回
+    cached = {}
+    for key, value in items_dict.items():
+        translated = memory_lookup(api_url, model_name, value)
+        if translated is not None:
+            cached[key] = translated
+    pending = {key: value for key, value in items_dict.items() if key not in cached}
+    if not pending:
+        return {key: cached[key] for key in items_dict}
+
+    translated_dict = request_batch(pending, text_widget, api_url, api_key, model_name)
+    if translated_dict is None:
+        return None
+    result = {}
+    for key, value in items_dict.items():
+        if key in cached:
+            result[key] = cached[key]
+        elif key in translated_dict:
+            result[key] = translated_dict[key]
+            memory_store(api_url, model_name, value, translated_dict[key])
+    return result
+
+def request_batch(items_dict, text_widget, api_url, api_key, model_name):
     input_json_str = json.dumps(items_dict, ensure_ascii=False, indent=2)
     headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
     payload = {
@@ -226,7 +316,7 @@ def translate_batch(items_dict, text_widget, api_url, api_key, model_name):
 
     for attempt in range(retries):
         try:
-            response = requests.post(api_url, headers=headers, json=payload, timeout=timeout_seconds)
+            response = api_post(api_url, headers=headers, json=payload, timeout=timeout_seconds)
             response.raise_for_status()
             response_text = response.json()['choices'][0]['message']['content'].strip()
             
@@ -389,7 +479,7 @@ def translate_lang_file(filepath, text_widget, api_url, api_key, model_name, pro
     process_file_concurrently(filepath, 'lang', to_translate, original_data, text_widget, api_url, api_key, model_name, progress_state, pause_event)
 
 
-def process_translations(texts_dirs, text_widget, api_url, api_key, model_name, pause_event):
+def process_translations(texts_dirs, text_widget, api_url, api_key, model_name, pause_event, progress_state=None):
     total_items = 0
     files_to_process = []
     for texts_dir in texts_dirs:
@@ -421,7 +511,10 @@ def process_translations(texts_dirs, text_widget, api_url, api_key, model_name,
 
     log_message(text_widget, f"已找到 {total_items} 个待翻译条目。")
     
-    progress_state = {'current': 0, 'total': total_items}
+    # 调用方可传入自己的进度字典（例如守护进程中的任务），以便在外部读取进度
+    if progress_state is None:
+        progress_state = {}
+    progress_state.update(current=0, total=total_items)
     for filepath in files_to_process:
         if filepath.endswith(".lang"):
             translate_lang_file(filepath, text_widget, api_url, api_key, model_name, progress_state, pause_event)
@@ -430,8 +523,57 @@ def process_translations(texts_dirs, text_widget, api_url, api_key, model_name,
 
 
 def repackage_archive(processed_dir, output_path):
-    shutil.make_archive(output_path.rsplit('.', 1)[0], 'zip', processed_dir)
-    os.rename(output_path.rsplit('.', 1)[0] + ".zip", output_path)
+    # 直接使用 zipfile 写入，不切换工作目录，守护进程中多个任务可以同时打包；
+    # 与 shutil.make_archive 一样写入目录条目，保留空目录
+    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+        for root, dirs, files in os.walk(processed_dir):
+            dirs.sort()
+            for dirname in dirs:
+                dirpath = os.path.join(root, dirname)
+                zip_ref.write(dirpath, os.path.relpath(dirpath, processed_dir))
+            for file in sorted(files):
+                filepath = os.path.join(root, file)
+                zip_ref.write(filepath, os.path.relpath(filepath, processed_dir))
+
+def translate_archive(mc_file_path, out_path, text_widget, api_url, api_key, model_name, pause_event, progress_state=None):
+    """完整的翻译流程：解压（含嵌套 .mcpack）、翻译硬编码字符串与语言文件、重新打包。"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_message(text_widget, f"📦 解压中 -> {tmpdir}")
+        extract_archive(mc_file_path, tmpdir)
+
+        log_message(text_widget, "  -> 正在检查嵌套的 .mcpack 文件...")
+        mcpacks_found = [os.path.join(root, file) for root, _, files in os.walk(tmpdir) for file in files if file.endswith(".mcpack")]
+        
+        if mcpacks_found:
+            log_message(text_widget, f"  -> 发现 {len(mcpacks_found)} 个 .mcpack，将进行二次解压。")
+            for mcpack_path in mcpacks_found:
+                pack_extract_dir = os.path.splitext(mcpack_path)[0]
+                os.makedirs(pack_extract_dir, exist_ok=True)
+                try:
+                    log_message(text_widget, f"    -> 正在解压: {os.path.basename(mcpack_path)}")
+                    extract_archive(mcpack_path, pack_extract_dir)
+                    os.remove(mcpack_path)
+                except Exception as e:
+                    log_message(text_widget, f"    -> ❌ 解压 {os.path.basename(mcpack_path)} 失败: {e}")
+        else:
+            log_message(text_widget, "  -> 未发现嵌套的 .mcpack 文件。")
+        
+        process_hardcoded_strings(tmpdir, text_widget, api_url, api_key, model_name, pause_event)
+
+        texts_dirs = []
+        for root, dirs, _ in os.walk(tmpdir):
+            if 'texts' in dirs:
+                texts_dirs.append(os.path.join(root, 'texts'))
+        
+        if not texts_dirs:
+            log_message(text_widget, "⚠️ 警告：在文件中未找到 'texts' 文件夹，将跳过语言文件翻译。")
+        else:
+            log_message(text_widget, f"✅ 找到 {len(texts_dirs)} 个 'texts' 文件夹，准备处理语言文件。")
+            log_message(text_widget, f"🌐 开始翻译语言文件 (使用 {model_name})...")
+            process_translations(texts_dirs, text_widget, api_url, api_key, model_name, pause_event, progress_state)
+
+        log_message(text_widget, "📦 重新打包中...")
+        repackage_archive(tmpdir, out_path)
 
 # --- 主应用逻辑 (与之前版本相同) ---
 
@@ -512,51 +654,15 @@ def start_translation_thread(mc_file_path, api_url, api_key, model_name, text_wi
                 messagebox.showerror("错误", "请在 API 设置中填写完整的 API 地址、密钥和模型名称。")
                 return
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                log_message(text_widget, f"📦 解压中 -> {tmpdir}")
-                extract_archive(mc_file_path, tmpdir)
-
-                log_message(text_widget, "  -> 正在检查嵌套的 .mcpack 文件...")
-                mcpacks_found = [os.path.join(root, file) for root, _, files in os.walk(tmpdir) for file in files if file.endswith(".mcpack")]
-                
-                if mcpacks_found:
-                    log_message(text_widget, f"  -> 发现 {len(mcpacks_found)} 个 .mcpack，将进行二次解压。")
-                    for mcpack_path in mcpacks_found:
-                        pack_extract_dir = os.path.splitext(mcpack_path)[0]
-                        os.makedirs(pack_extract_dir, exist_ok=True)
-                        try:
-                            log_message(text_widget, f"    -> 正在解压: {os.path.basename(mcpack_path)}")
-                            extract_archive(mcpack_path, pack_extract_dir)
-                            os.remove(mcpack_path)
-                        except Exception as e:
-                            log_message(text_widget, f"    -> ❌ 解压 {os.path.basename(mcpack_path)} 失败: {e}")
-                else:
-                    log_message(text_widget, "  -> 未发现嵌套的 .mcpack 文件。")
-                
-                process_hardcoded_strings(tmpdir, text_widget, api_url, api_key, model_name, pause_event)
-
-                texts_dirs = []
-                for root, dirs, _ in os.walk(tmpdir):
-                    if 'texts' in dirs:
-                        texts_dirs.append(os.path.join(root, 'texts'))
-                
-                if not texts_dirs:
-                    log_message(text_widget, "⚠️ 警告：在文件中未找到 'texts' 文件夹，将跳过语言文件翻译。")
-                else:
-                    log_message(text_widget, f"✅ 找到 {len(texts_dirs)} 个 'texts' 文件夹，准备处理语言文件。")
-                    log_message(text_widget, f"🌐 开始翻译语言文件 (使用 {model_name})...")
-                    process_translations(texts_dirs, text_widget, api_url, api_key, model_name, pause_event)
-
-                if mc_file_path.endswith(".mcpack"):
-                    out_path = mc_file_path.replace(".mcpack", "_translated.mcpack")
-                else:
-                    out_path = mc_file_path.replace(".mcaddon", "_translated.mcaddon")
+            if mc_file_path.endswith(".mcpack"):
+                out_path = mc_file_path.replace(".mcpack", "_translated.mcpack")
+            else:
+                out_path = mc_file_path.replace(".mcaddon", "_translated.mcaddon")
 
-                log_message(text_widget, "📦 重新打包中...")
-                repackage_archive(tmpdir, out_path)
+            translate_archive(mc_file_path, out_path, text_widget, api_url, api_key, model_name, pause_event)
 
-                log_message(text_widget, "--------------------")
-                log_message(text_widget, f"✅ 翻译完成！文件保存为：{out_path}")
+            log_message(text_widget, "--------------------")
+            log_message(text_widget, f"✅ 翻译完成！文件保存为：{out_path}")
 
         except Exception:
             log_message(text_widget, "\n❌ 程序发生未预料的错误：")
@@ -663,5 +769,377 @@ def create_gui():
     root.protocol("WM_DELETE_WINDOW", on_closing)
     root.mainloop()
 
+# --- 守护进程模式：本地 HTTP API + 共享优先级队列 ---
+
+# 默认的上传大小上限（MB）
+DEFAULT_MAX_UPLOAD_MB = 200
+# 已结束任务的默认保留策略：保留时长（小时）与最多保留数量
+DEFAULT_JOB_TTL_HOURS = 24
+DEFAULT_MAX_FINISHED_JOBS = 100
+
+class TranslationJob:
+    """守护进程中的一个翻译任务。
+
+    提供与日志文本框相同的 insert/see 接口，可直接作为 text_widget 传给后端函数。
+    """
+
+    def __init__(self, job_id, name, priority, input_path, output_path):
+        self.job_id = job_id
+        self.name = name
+        self.priority = priority
+        self.input_path = input_path
+        self.output_path = output_path
+        self.status = "queued"
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.progress = {'current': 0, 'total': 0}
+        self.logs = deque(maxlen=1000)
+        self.pause_event = threading.Event()
+        self.pause_event.set()
+
+    def insert(self, index, message):
+        self.logs.extend(message.rstrip("\n").splitlines())
+
+    def see(self, index):
+        pass
+
+    def to_dict(self, log_lines=50):
+        return {
+            "job_id": self.job_id,
+            "name": self.name,
+            "priority": self.priority,
+            "status": self.status,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": dict(self.progress),
+            "logs": list(self.logs)[-log_lines:] if log_lines else [],
+        }
+
+
+class TranslationService:
+    """管理任务队列与工作线程；所有任务共享同一份配置、连接池和翻译记忆。"""
+
+    def __init__(self, config, work_dir, workers=2, job_ttl=DEFAULT_JOB_TTL_HOURS * 3600, max_finished_jobs=DEFAULT_MAX_FINISHED_JOBS):
+        self.config = config
+        self.work_dir = work_dir
+        self.job_ttl = job_ttl
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.job_queue = queue.PriorityQueue()
+        self._sequence = 0
+        for i in range(workers):
+            thread = threading.Thread(target=self._worker, name=f"translation-worker-{i}")
+            thread.daemon = True
+            thread.start()
+        thread = threading.Thread(target=self._janitor, name="translation-janitor")
+        thread.daemon = True
+        thread.start()
+
+    def submit(self, name, stream, length, priority=0):
+        """保存上传的压缩包并加入队列。优先级数值越大越先处理。"""
+        job_id = uuid.uuid4().hex
+        job_dir = os.path.join(self.work_dir, job_id)
+        os.makedirs(job_dir)
+        ext = os.path.splitext(name)[1]
+        input_path = os.path.join(job_dir, "input" + ext)
+        output_path = os.path.join(job_dir, "output" + ext)
+
+        remaining = length
+        try:
+            with open(input_path, "wb") as f:
+                while remaining > 0:
+                    chunk = stream.read(min(remaining, 1024 * 1024))
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    remaining -= len(chunk)
+        except Exception:
+            # 例如客户端上传中途超时：清理已写入的部分文件后再抛出
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise
+        if remaining > 0 or not zipfile.is_zipfile(input_path):
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise ValueError("上传的内容不是有效的 .mcpack/.mcaddon 压缩包")
+
+        job = TranslationJob(job_id, name, priority, input_path, output_path)
+        with self.lock:
+            self.jobs[job_id] = job
+            self._sequence += 1
+            self.job_queue.put((-priority, self._sequence, job_id))
+        log_message(job, f"任务已加入队列 (优先级 {priority})")
+        return job
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def list(self):
+        with self.lock:
+            return list(self.jobs.values())
+
+    def delete(self, job_id):
+        """删除未在运行中的任务及其文件；排队中的任务会被取消。"""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status == "running":
+                return job
+            del self.jobs[job_id]
+            if job.status == "queued":
+                job.status = "cancelled"
+        shutil.rmtree(os.path.dirname(job.input_path), ignore_errors=True)
+        return job
+
+    def evict_finished(self, now=None):
+        """按保留策略清理已结束的任务：超过保留时长的，以及超出数量上限的最旧任务。"""
+        now = time.time() if now is None else now
+        with self.lock:
+            finished = sorted(
+                (job for job in self.jobs.values() if job.status in ("done", "failed") and job.finished_at is not None),
+                key=lambda job: job.finished_at
+            )
+            overflow = max(0, len(finished) - self.max_finished_jobs)
+            expired = [job for i, job in enumerate(finished) if i < overflow or now - job.finished_at > self.job_ttl]
+            for job in expired:
+                del self.jobs[job.job_id]
+        for job in expired:
+            shutil.rmtree(os.path.dirname(job.input_path), ignore_errors=True)
+        return expired
+
+    def _janitor(self):
+        while True:
+            time.sleep(60)
+            try:
+                self.evict_finished()
+            except Exception:
+                traceback.print_exc()
+
+    def _worker(self):
+        while True:
+            _, _, job_id = self.job_queue.get()
+            with self.lock:
+                job = self.jobs.get(job_id)
+                if job is None or job.status != "queued":
+                    continue
+                job.status = "running"
+                job.started_at = time.time()
+            try:
+                log_message(job, "--- 开始翻译流程 ---")
+                translate_archive(
+                    job.input_path, job.output_path, job,
+                    self.config["api_url"], self.config["api_key"], self.config["model_name"],
+                    job.pause_event, job.progress
+                )
+                log_message(job, "✅ 翻译完成！")
+                status = "done"
+            except Exception as e:
+                log_message(job, "\n❌ 程序发生未预料的错误：")
+                log_message(job, traceback.format_exc())
+                job.error = str(e)
+                status = "failed"
+            # 结束时间与最终状态一起在锁内设置，清理线程不会看到没有结束时间的已结束任务
+            with self.lock:
+                job.finished_at = time.time()
+                job.status = status
+            try:
+                self.evict_finished()
+            except Exception:
+                traceback.print_exc()
+
+
+class TranslationRequestHandler(BaseHTTPRequestHandler):
+    """守护进程的 HTTP 接口。
+
+    POST   /jobs?name=xxx.mcpack&priority=0  请求体为压缩包内容，返回任务信息
+    GET    /jobs                             列出所有任务
+    GET    /jobs/<id>                        查询任务状态、进度和最近日志
+    GET    /jobs/<id>/result                 下载翻译后的压缩包
+    DELETE /jobs/<id>                        取消排队中的任务或删除已结束的任务
+    """
+
+    # 套接字读写超时（秒），避免上传不完整的客户端永久占用处理线程
+    timeout = 60
+
+    def _send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self):
+        """校验令牌并拆分路径，返回 (路径片段, 查询参数)；校验失败时返回 None。"""
+        token = self.server.token
+        if token and not hmac.compare_digest(self.headers.get("Authorization", "").encode("utf-8"), f"Bearer {token}".encode("utf-8")):
+            self._send_json(401, {"error": "未授权"})
+            return None
+        parsed = urlparse(self.path)
+        parts = [part for part in parsed.path.split("/") if part]
+        if not parts or parts[0] != "jobs":
+            self._send_json(404, {"error": "未找到"})
+            return None
+        return parts[1:], parse_qs(parsed.query)
+
+    def do_POST(self):
+        route = self._route()
+        if route is None:
+            return
+        parts, query = route
+        if parts:
+            self._send_json(404, {"error": "未找到"})
+            return
+        name = os.path.basename(query.get("name", [""])[0])
+        if not (name.endswith(".mcpack") or name.endswith(".mcaddon")):
+            self._send_json(400, {"error": "参数 name 必须是 .mcpack 或 .mcaddon 文件名"})
+            return
+        try:
+            priority = int(query.get("priority", ["0"])[0])
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._send_json(400, {"error": "priority 或 Content-Length 无效"})
+            return
+        if length < 0:
+            self._send_json(400, {"error": "Content-Length 无效"})
+            return
+        if length > self.server.max_upload_size:
+            self._send_json(413, {"error": f"上传文件超过大小上限 ({self.server.max_upload_size} 字节)"})
+            return
+        try:
+            job = self.server.service.submit(name, self.rfile, length, priority)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        self._send_json(202, job.to_dict())
+
+    def do_GET(self):
+        route = self._route()
+        if route is None:
+            return
+        parts, query = route
+        service = self.server.service
+        if not parts:
+            self._send_json(200, {"jobs": [job.to_dict(log_lines=0) for job in service.list()]})
+            return
+        job = service.get(parts[0])
+        if job is None or len(parts) > 2 or (len(parts) == 2 and parts[1] != "result"):
+            self._send_json(404, {"error": "未找到"})
+            return
+        if len(parts) == 1:
+            self._send_json(200, job.to_dict())
+            return
+        if job.status != "done":
+            self._send_json(409, {"error": f"任务尚未完成 (状态: {job.status})"})
+            return
+        # 先打开文件再发送响应头：任务可能同时被删除或清理
+        try:
+            f = open(job.output_path, "rb")
+        except OSError:
+            self._send_json(404, {"error": "未找到"})
+            return
+        with f:
+            base, ext = os.path.splitext(job.name)
+            filename = quote(f"{base}_translated{ext}")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+            self.send_header("Content-Disposition", f"attachment; filename*=UTF-8''{filename}")
+            self.end_headers()
+            shutil.copyfileobj(f, self.wfile)
+
+    def do_DELETE(self):
+        route = self._route()
+        if route is None:
+            return
+        parts, query = route
+        if len(parts) != 1:
+            self._send_json(404, {"error": "未找到"})
+            return
+        job = self.server.service.delete(parts[0])
+        if job is None:
+            self._send_json(404, {"error": "未找到"})
+        elif job.status == "running":
+            self._send_json(409, {"error": "任务正在运行，无法删除"})
+        else:
+            self._send_json(200, job.to_dict(log_lines=0))
+
+
+def is_loopback_host(host):
+    """判断监听地址是否只允许本机访问。"""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+def run_server(host, port, workers, max_api_concurrency, token=None, work_dir=None, max_upload_mb=DEFAULT_MAX_UPLOAD_MB,
+               job_ttl_hours=DEFAULT_JOB_TTL_HOURS, max_finished_jobs=DEFAULT_MAX_FINISHED_JOBS):
+    """以守护进程模式启动本地翻译服务。"""
+    # 服务使用 config.json 中的 API 密钥，对外开放时必须设置访问令牌
+    if not token and not is_loopback_host(host):
+        print(f"错误：监听非本机地址 {host} 时必须使用 --token 设置访问令牌。")
+        return
+    if workers < 1:
+        print("错误：--workers 必须至少为 1，否则提交的任务永远不会被处理。")
+        return
+    if max_api_concurrency < 1:
+        print("错误：--max-api-concurrency 必须至少为 1。")
+        return
+    config = load_config()
+    if not config.get("api_url") or not config.get("api_key") or not config.get("model_name"):
+        print("错误：config.json 中的 API 地址、密钥或模型名称不完整，请先在 GUI 中保存配置。")
+        return
+    try:
+        server = ThreadingHTTPServer((host, port), TranslationRequestHandler)
+    except OSError as e:
+        print(f"错误：无法在 {host}:{port} 上启动服务: {e}")
+        return
+    server.daemon_threads = True
+    set_api_concurrency(max_api_concurrency)
+    # 仅在使用默认临时目录时于退出时整体删除，用户指定的目录只清理各任务子目录
+    temp_work_dir = None
+    try:
+        if not work_dir:
+            work_dir = temp_work_dir = tempfile.mkdtemp(prefix="mcpack_translate_")
+        os.makedirs(work_dir, exist_ok=True)
+    except OSError as e:
+        print(f"错误：无法创建工作目录: {e}")
+        server.server_close()
+        return
+    server.service = TranslationService(config, work_dir, workers, job_ttl_hours * 3600, max_finished_jobs)
+    server.token = token
+    server.max_upload_size = max_upload_mb * 1024 * 1024
+    print(f"翻译服务已启动: http://{host}:{port} (工作线程 {workers}，API 并发上限 {max_api_concurrency}，工作目录 {work_dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("正在停止翻译服务...")
+    finally:
+        server.server_close()
+        if temp_work_dir:
+            shutil.rmtree(temp_work_dir, ignore_errors=True)
+
+
 if __name__ == "__main__":
-    create_gui()
+    parser = argparse.ArgumentParser(description="Minecraft Addon ai简单翻译工具")
+    parser.add_argument("--serve", action="store_true", help="以守护进程模式运行本地 HTTP 翻译服务，而不是打开 GUI")
+    parser.add_argument("--host", default="127.0.0.1", help="服务监听地址 (默认 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="服务监听端口 (默认 8765)")
+    parser.add_argument("--workers", type=int, default=2, help="同时处理的任务数，至少为 1 (默认 2)")
+    parser.add_argument("--max-api-concurrency", type=int, default=5, help="所有任务共享的 API 并发上限，至少为 1 (默认 5)")
+    parser.add_argument("--token", help="访问令牌，客户端需发送 'Authorization: Bearer <令牌>'；监听非本机地址时必填")
+    parser.add_argument("--max-upload-mb", type=int, default=DEFAULT_MAX_UPLOAD_MB, help=f"单个上传文件的大小上限，单位 MB (默认 {DEFAULT_MAX_UPLOAD_MB})")
+    parser.add_argument("--job-ttl-hours", type=float, default=DEFAULT_JOB_TTL_HOURS, help=f"已结束任务的保留时长，单位小时 (默认 {DEFAULT_JOB_TTL_HOURS})")
+    parser.add_argument("--max-finished-jobs", type=int, default=DEFAULT_MAX_FINISHED_JOBS, help=f"最多保留的已结束任务数 (默认 {DEFAULT_MAX_FINISHED_JOBS})")
+    parser.add_argument("--work-dir", help="存放上传与输出文件的目录 (默认使用临时目录)")
+    args = parser.parse_args()
+    if args.serve:
+        run_server(args.host, args.port, args.workers, args.max_api_concurrency, args.token, args.work_dir, args.max_upload_mb,
+                   args.job_ttl_hours, args.max_finished_jobs)
+    else:
+        create_gui()